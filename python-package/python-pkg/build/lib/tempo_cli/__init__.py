@@ -1,10 +0,0 @@
-"""
-Tempo CLI - The Most Advanced Automatic Project Time Tracker
-
-This package provides a Python wrapper for the Tempo time tracking CLI tool,
-which is written in Rust for lightning-fast performance and cross-platform compatibility.
-"""
-
-__version__ = "1.0.0"
-__author__ = "Own Path"
-__email__ = "brandy.daryl@gmail.com"
\ No newline at end of file
@@ -1,21 +1,84 @@
 #!/usr/bin/env python3
 
+import hashlib
 import os
 import sys
 import platform
 import subprocess
-from setuptools import setup, find_packages
-from setuptools.command.install import install
+from setuptools import setup
+from setuptools.command.build_py import build_py
+from setuptools.errors import ExecError, FileError, PlatformError
 
-class PostInstallCommand(install):
-    """Post-installation for installing the Tempo binary"""
+# setup.py may run without its own directory on sys.path (PEP 517 builds)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import fastentrypoints  # noqa: F401  (patches console_script generation)
+
+try:
+    from setuptools.command.bdist_wheel import bdist_wheel
+except ImportError:
+    from wheel.bdist_wheel import bdist_wheel
+
+# Release CI places the prebuilt Rust binaries here before building a wheel
+BUNDLED_BINARY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tempo_cli", "bin")
+
+def tempo_binary_names():
+    """Binaries every wheel must bundle for the build platform"""
+    # tempo start launches tempo-daemon from tempo's own directory
+    suffix = ".exe" if platform.system().lower() == "windows" else ""
+    return [name + suffix for name in ("tempo", "tempo-daemon")]
+
+class HashingReader:
+    """File-like wrapper that computes a SHA-256 of everything read through it"""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.sha256 = hashlib.sha256()
+
+    def read(self, size=-1):
+        data = self.raw.read(size)
+        self.sha256.update(data)
+        return data
+
+    def hexdigest(self):
+        return self.sha256.hexdigest()
+
+class PlatformWheelCommand(bdist_wheel):
+    """Tag wheels for the platform of the Tempo binary they bundle"""
+
+    def finalize_options(self):
+        super().finalize_options()
+        self.root_is_pure = False
+
+    def get_tag(self):
+        _, _, platform_tag = super().get_tag()
+        # The wrapper is pure Python; only the binary is platform specific
+        return "py3", "none", platform_tag
+
+class BuildPyCommand(build_py):
+    """Bundle the Tempo binary into the package when building a wheel"""
     
     def run(self):
-        install.run(self)
-        self.install_tempo_binary()
+        build_py.run(self)
+        # Editable installs import tempo_cli from the source tree, so anything
+        # placed in build_lib would never be used
+        if getattr(self, "editable_mode", False):
+            return
+        # Release CI copies cross-compiled binaries into tempo_cli/bin itself
+        bundled = [
+            name for name in tempo_binary_names()
+            if os.path.isfile(os.path.join(BUNDLED_BINARY_DIR, name))
+        ]
+        if not bundled:
+            self.bundle_tempo_binary()
+        elif len(bundled) != len(tempo_binary_names()):
+            missing = sorted(set(tempo_binary_names()) - set(bundled))
+            raise FileError(
+                f"{BUNDLED_BINARY_DIR} is missing {', '.join(missing)}; "
+                "bundle every Tempo binary or none of them"
+            )
     
-    def install_tempo_binary(self):
-        """Download and install the appropriate Tempo binary"""
+    def bundle_tempo_binary(self):
+        """Fetch or compile the Tempo binaries for this platform"""
         system = platform.system().lower()
         machine = platform.machine().lower()
         
@@ -33,84 +96,129 @@ class PostInstallCommand(install):
         elif system == "windows":
             target = "x86_64-pc-windows-msvc"
         else:
-            print(f"Unsupported platform: {system} {machine}")
-            print("Please install Tempo manually with: cargo install tempo-cli")
-            return
+            raise PlatformError(
+                f"Unsupported platform: {system} {machine}. "
+                "Please install Tempo manually with: cargo install tempo-cli"
+            )
         
-        # Install via cargo as it's the most reliable method
+        binary_names = tempo_binary_names()
+        version = self.distribution.get_version()
+        cache_root = os.path.join(
+            os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+            "tempo-cli", version, target,
+        )
+        cache_bin_dir = os.path.join(cache_root, "bin")
+
+        # Rebuilds of the same version reuse the binaries fetched or built last time
+        if all(
+            os.path.isfile(os.path.join(cache_bin_dir, name))
+            and os.access(os.path.join(cache_bin_dir, name), os.X_OK)
+            for name in binary_names
+        ):
+            print(f"Using cached Tempo binaries from {cache_root}")
+            self.copy_tempo_binaries(cache_bin_dir, binary_names)
+            return
+
+        # Prefer the prebuilt release binaries; compiling is the slow fallback
+        if self.download_tempo_binary(version, target, binary_names, cache_bin_dir):
+            self.copy_tempo_binaries(cache_bin_dir, binary_names)
+            return
+
+        # Compile via cargo as the last resort. Failing the build is deliberate:
+        # a wheel without the binaries would be cached by pip and reused even
+        # after Rust is installed.
         try:
-            print("Installing Tempo via cargo...")
-            subprocess.check_call([sys.executable, "-c", "import subprocess; subprocess.check_call(['cargo', 'install', 'tempo-cli'])"])
-            print("Tempo installed successfully!")
-            print("\nQuick start:")
-            print("  tempo start               # Start the daemon")
-            print("  tempo status              # Check status")
-            print("  tempo session start      # Begin tracking")
-            print("  tempo list                # View projects")
-            print("  tempo dashboard           # Interactive dashboard")
+            print("Building Tempo via cargo...")
+            subprocess.check_call([
+                "cargo", "install", "tempo-cli",
+                "--version", version,
+                "--root", cache_root,
+            ])
         except subprocess.CalledProcessError:
-            print("Failed to install via cargo.")
-            print("Please ensure Rust is installed: https://rustup.rs/")
-            print("Then run: cargo install tempo-cli")
+            raise ExecError(
+                "Failed to build Tempo via cargo. "
+                "Please ensure Rust is installed: https://rustup.rs/"
+            )
         except FileNotFoundError:
-            print("Cargo not found. Please install Rust first: https://rustup.rs/")
-            print("Then run: cargo install tempo-cli")
+            raise ExecError(
+                "No prebuilt Tempo binary is available for this platform and cargo "
+                "was not found. Please install Rust first: https://rustup.rs/"
+            )
+        self.copy_tempo_binaries(cache_bin_dir, binary_names)
+
+    def download_tempo_binary(self, version, target, binary_names, destination_dir):
+        """Fetch and verify the GitHub release binaries, returning True on success"""
+        import http.client
+        import shutil
+        import tarfile
+        import urllib.request
+
+        archive_url = (
+            f"https://github.com/own-path/vibe/releases/download/"
+            f"v{version}/tempo-{version}-{target}.tar.gz"
+        )
+        partials = {
+            name: os.path.join(destination_dir, name + ".part") for name in binary_names
+        }
+        extracted = set()
+        try:
+            print(f"Downloading prebuilt Tempo binaries for {target}...")
+            with urllib.request.urlopen(archive_url + ".sha256", timeout=30) as response:
+                expected_sha256 = response.read().decode("ascii").split()[0].lower()
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+            os.makedirs(destination_dir, exist_ok=True)
+            with urllib.request.urlopen(archive_url, timeout=30) as response:
+                # Hash while extracting so the archive is never buffered or
+                # written to disk as a whole
+                stream = HashingReader(response)
+                with tarfile.open(fileobj=stream, mode="r|gz") as tar:
+                    for member in tar:
+                        if member.name in partials and member.isfile():
+                            with open(partials[member.name], "wb") as f:
+                                shutil.copyfileobj(tar.extractfile(member), f)
+                            extracted.add(member.name)
+                            if len(extracted) == len(partials):
+                                break
+                # tarfile stops at the end-of-archive marker; hash the rest too
+                while stream.read(64 * 1024):
+                    pass
+        except (OSError, ValueError, IndexError, tarfile.TarError,
+                http.client.HTTPException) as e:
+            print(f"Prebuilt binaries unavailable ({e}), falling back to cargo")
+            ok = False
+        else:
+            missing = sorted(set(partials) - extracted)
+            ok = False
+            if missing:
+                print(f"Release archive has no {', '.join(missing)}, falling back to cargo")
+            elif stream.hexdigest() != expected_sha256:
+                print("Prebuilt binaries failed checksum verification, falling back to cargo")
+            else:
+                ok = True
+
+        if not ok:
+            for partial in partials.values():
+                if os.path.exists(partial):
+                    os.remove(partial)
+            return False
+
+        for name, partial in partials.items():
+            os.chmod(partial, 0o755)
+            os.replace(partial, os.path.join(destination_dir, name))
+        return True
 
+    def copy_tempo_binaries(self, source_dir, binary_names):
+        """Place the binaries where the tempo_cli wrapper looks for them first"""
+        bin_dir = os.path.join(self.build_lib, "tempo_cli", "bin")
+        os.makedirs(bin_dir, exist_ok=True)
+        for name in binary_names:
+            self.copy_file(os.path.join(source_dir, name), os.path.join(bin_dir, name))
+
+# Static metadata (including the README long description) lives in
+# pyproject.toml; setup.py only wires in the custom build commands.
 setup(
-    name="tempo-tracker-cli",
-    version="0.3.4",
-    author="Own Path",
-    author_email="brandy.daryl@gmail.com",
-    description="The Most Advanced Automatic Project Time Tracker - Lightning-fast Rust-powered CLI",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/own-path/vibe",
-    project_urls={
-        "Bug Tracker": "https://github.com/own-path/vibe/issues",
-        "Documentation": "https://docs.rs/tempo",
-        "Source Code": "https://github.com/own-path/vibe",
-        "PyPI": "https://pypi.org/project/tempo-tracker-cli/",
-    },
-    classifiers=[
-        "Development Status :: 5 - Production/Stable",
-        "Intended Audience :: Developers",
-        "Intended Audience :: Information Technology",
-        "License :: OSI Approved :: MIT License",
-        "Operating System :: MacOS",
-        "Operating System :: POSIX :: Linux", 
-        "Operating System :: Microsoft :: Windows",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-        "Programming Language :: Rust",
-        "Topic :: Office/Business :: Scheduling",
-        "Topic :: Software Development",
-        "Topic :: System :: Monitoring",
-        "Topic :: Utilities",
-        "Environment :: Console",
-    ],
-    packages=find_packages(),
-    python_requires=">=3.8",
     cmdclass={
-        'install': PostInstallCommand,
-    },
-    entry_points={
-        'console_scripts': [
-            'tempo=tempo_cli.main:main',
-        ],
+        'build_py': BuildPyCommand,
+        'bdist_wheel': PlatformWheelCommand,
     },
-    keywords=[
-        "time-tracking", "productivity", "cli", "terminal", "rust", 
-        "project-management", "goals", "analytics", "developer-tools",
-        "workspace", "session-tracking", "automatic", "daemon"
-    ],
-    install_requires=[
-        # No Python dependencies needed - we're just a wrapper
-    ],
-)
\ No newline at end of file
+)
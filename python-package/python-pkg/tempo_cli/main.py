@@ -2,72 +2,125 @@
 """
 Python wrapper for the Tempo CLI tool.
 
-This script acts as a Python entry point that calls the actual Tempo binary.
+This script acts as a Python entry point that execs the actual Tempo binary.
 """
 
+import os
 import sys
-import subprocess
-import shutil
 
-def main():
-    """Main entry point that forwards all arguments to the tempo binary"""
-    
-    # Look for the actual tempo binary (not the Python wrapper)
-    tempo_path = None
-    
+def bundled_binary():
+    """Return the binary shipped inside a platform wheel, if present"""
+    # A plain path join rather than importlib.resources: the package is never
+    # zipped (the binary has to be exec'd from disk) and importing
+    # importlib.resources would add tens of milliseconds to every invocation.
+    name = 'tempo.exe' if os.name == 'nt' else 'tempo'
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bin', name)
+    if os.access(path, os.X_OK):
+        return path
+    return None
+
+def _cache_file():
+    """Path of the file remembering where the tempo binary was found"""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache_home, 'tempo', 'bin-path')
+
+def read_cached_binary():
+    """Return the previously resolved binary path if it is still executable"""
+    try:
+        with open(_cache_file(), 'r', encoding='utf-8') as f:
+            path = f.read().strip()
+    except OSError:
+        return None
+
+    if path and os.access(path, os.X_OK):
+        return path
+    return None
+
+def write_cached_binary(path):
+    """Remember the resolved binary path for subsequent invocations"""
+    cache_file = _cache_file()
+    tmp_file = f"{cache_file}.{os.getpid()}"
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(path)
+        # Atomic swap so concurrent invocations never read a partial path
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # Caching is best-effort; a read-only home must not break the CLI
+        pass
+
+def which_first(names):
+    """Return the first executable named any of `names` in a single PATH scan"""
+    if os.name == 'nt':
+        names = [name + '.exe' for name in names]
+    for directory in os.get_exec_path():
+        for name in names:
+            path = os.path.join(directory, name)
+            if os.path.isfile(path) and os.access(path, os.X_OK):
+                return path
+    return None
+
+def find_tempo_binary():
+    """Locate the actual tempo binary (not the Python wrapper)"""
     # First try to find tempo-bin or tempo-rs (alternative names)
-    for binary_name in ['tempo-bin', 'tempo-rs']:
-        tempo_path = shutil.which(binary_name)
-        if tempo_path:
-            break
+    tempo_path = which_first(['tempo-bin', 'tempo-rs'])
     
     # If not found, look for 'tempo' but exclude the Python wrapper
     if not tempo_path:
-        # Get all tempo executables in PATH
-        for path_dir in sys.path if hasattr(sys, 'path') else []:
-            continue
-        
         # Check common installation locations
-        import os
         possible_paths = [
             os.path.expanduser('~/.cargo/bin/tempo'),
             '/usr/local/bin/tempo-bin',
             '/opt/homebrew/bin/tempo-bin'
         ]
         
+        # Skip any candidate that is actually this wrapper's own launcher
+        wrapper_path = os.path.realpath(sys.argv[0])
         for path in possible_paths:
-            if os.path.isfile(path) and os.access(path, os.X_OK):
-                # Check if this is not a Python script
-                try:
-                    with open(path, 'rb') as f:
-                        header = f.read(50)
-                        if b'python' not in header.lower():
-                            tempo_path = path
-                            break
-                except:
-                    continue
+            if (os.path.isfile(path) and os.access(path, os.X_OK)
+                    and os.path.realpath(path) != wrapper_path):
+                tempo_path = path
+                break
+
+    return tempo_path
+
+def main():
+    """Main entry point that forwards all arguments to the tempo binary"""
     
+    # Platform wheels ship the binary next to this module
+    tempo_path = bundled_binary()
+
+    # Otherwise reuse the location resolved by a previous run
     if not tempo_path:
-        print("❌ Tempo binary not found in PATH.")
+        tempo_path = read_cached_binary()
+    if not tempo_path:
+        tempo_path = find_tempo_binary()
+        if tempo_path:
+            write_cached_binary(tempo_path)
+
+    if not tempo_path:
+        print("[ERROR] Tempo binary not found (checked the bundled binary, the cached path and PATH).")
         print("\nThis usually means the installation didn't complete successfully.")
         print("Please try one of these alternatives:")
-        print("  1. Install via cargo: cargo install tempo")
-        print("  2. Install via homebrew: brew install tempo")
-        print("  3. Reinstall this package: pip install --force-reinstall tempo-cli")
+        print("  1. Reinstall this package: pip install --prefer-binary --force-reinstall tempo-tracker-cli")
+        print("  2. Install via cargo: cargo install tempo-cli")
         sys.exit(1)
     
-    # Forward all arguments to the actual tempo binary
-    try:
-        # Use subprocess to call the tempo binary with all arguments
-        result = subprocess.run([tempo_path] + sys.argv[1:], 
-                              check=False,
-                              text=True)
-        sys.exit(result.returncode)
-    except KeyboardInterrupt:
-        sys.exit(130)  # Standard exit code for SIGINT
-    except Exception as e:
-        print(f"❌ Error running tempo: {e}")
-        sys.exit(1)
+    argv = [tempo_path] + sys.argv[1:]
+    if os.name == 'nt':
+        # Windows has no real exec: os.execv starts a new process and exits
+        # straight away, losing the exit status, so wait for the child instead.
+        # subprocess quotes arguments correctly where os.spawnv does not.
+        import signal
+        import subprocess
+        # Ctrl+C reaches every process on the console; leave it to tempo
+        # rather than dying with a KeyboardInterrupt traceback
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        sys.exit(subprocess.call(argv))
+
+    # Replace this process with the tempo binary, forwarding all arguments
+    os.execvp(tempo_path, argv)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -45,7 +45,9 @@ if [[ ! -d "dist" ]] || [[ -z "$(ls -A dist 2>/dev/null)" ]]; then
     
     # Clean and build
     rm -rf dist/ build/ *.egg-info/
-    python -m build
+    # Platform wheels with the bundled binary are built by release.yml;
+    # a local wheel would be tagged for this machine only
+    python -m build --sdist
     
     echo -e "${GREEN}✓ Package built successfully${NC}"
 else
@@ -111,10 +113,10 @@ if [[ $? -eq 0 ]]; then
     echo -e "${GREEN}Package URL: https://pypi.org/project/tempo-tracker-cli/$CARGO_VERSION/${NC}"
     echo ""
     echo -e "${BLUE}Installation command:${NC}"
-    echo -e "${GREEN}pip install tempo-tracker-cli==$CARGO_VERSION${NC}"
+    echo -e "${GREEN}pip install --prefer-binary tempo-tracker-cli==$CARGO_VERSION${NC}"
     echo ""
     echo -e "${BLUE}Upgrade command:${NC}"
-    echo -e "${GREEN}pip install --upgrade tempo-tracker-cli${NC}"
+    echo -e "${GREEN}pip install --prefer-binary --upgrade tempo-tracker-cli${NC}"
 else
     echo -e "${RED}✗ Failed to publish to PyPI${NC}"
     exit 1
@@ -43,11 +43,6 @@ update_file "python-package/python-pkg/pyproject.toml" \
            "s/^version = \".*\"/version = \"$VERSION\"/" \
            "pyproject.toml"
 
-# Update setup.py
-update_file "python-package/python-pkg/setup.py" \
-           "s/version=\".*\"/version=\"$VERSION\"/" \
-           "setup.py"
-
 # Update any other version files that might exist
 if [ -f "VERSION" ]; then
     echo "$VERSION" > VERSION